@@ -8,6 +8,7 @@
 # ...from standard library
 import abc
 import itertools
+import operator
 import types
 import warnings
 from typing import *
@@ -24,6 +25,7 @@ import hydpy
 from hydpy.core import devicetools
 from hydpy.core import hydpytools
 from hydpy.core import masktools
+from hydpy.core import modeltools
 from hydpy.core import objecttools
 from hydpy.core import parametertools
 from hydpy.core import selectiontools
@@ -42,6 +44,39 @@ RuleType2 = TypeVar(
 )
 
 
+class _NullContext:
+    """Context manager doing nothing (as `contextlib.nullcontext`, which is
+    not available in Python 3.6)."""
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NULLCONTEXT = _NullContext()
+
+_PLAIN_CALLS = (
+    parametertools.Parameter.__call__,
+    parametertools.ZipParameter.__call__,
+)
+
+_MODELTYPE2CONTROLNAMES: Dict[Type[modeltools.Model], FrozenSet[str]] = {}
+
+
+def _get_controlparameternames(model: modeltools.Model) -> FrozenSet[str]:
+    """Return the names of all control parameters of the given model.
+
+    The names are determined only once for each |Model| subclass.
+    """
+    names = _MODELTYPE2CONTROLNAMES.get(type(model))
+    if names is None:
+        names = frozenset(par.name for par in model.parameters.control)
+        _MODELTYPE2CONTROLNAMES[type(model)] = names
+    return names
+
+
 class TargetFunction(Protocol):
     """Protocol class for the target function required by class
     |CalibrationInterface|.
@@ -158,7 +193,10 @@ class SumAdaptor(Adaptor):
         self,
         target: parametertools.Parameter,
     ) -> None:
-        target(sum(rule.value for rule in self._rules))
+        value = 0.0
+        for rule in self._rules:
+            value += rule.value
+        target(value)
 
 
 class FactorAdaptor(Adaptor):
@@ -285,11 +323,24 @@ class FactorAdaptor(Adaptor):
     >>> print_values(control.gmelt.values)
     3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 9.11706, 5.470236, 9.11706, 5.470236,
     9.11706, 5.470236
+
+    |FactorAdaptor| determines the mask anew for each call, so it takes
+    changes in the zone types into account (the seventh zone is now a
+    glacier zone, but its value of parameter |hland_control.CFMax| still
+    stems from being a field zone):
+
+    >>> control.zonetype(GLACIER, GLACIER, GLACIER, GLACIER, GLACIER, GLACIER,
+    ...                  GLACIER, FOREST, ILAKE, FIELD, FOREST, ILAKE)
+    >>> gmelt.apply_value()
+    >>> print_values(control.gmelt.values)
+    3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 2.5, 5.470236, 9.11706, 5.470236,
+    9.11706, 5.470236
     """
 
     _rule: "Rule"
     _reference: str
     _mask: Optional[str]
+    _target2reference: Dict[parametertools.Parameter, parametertools.Parameter]
 
     def __init__(
         self,
@@ -306,16 +357,27 @@ class FactorAdaptor(Adaptor):
         self._rule = rule
         self._reference = str(getattr(reference, "name", reference))
         self._mask = getattr(mask, "name", mask) if mask else None
+        self._target2reference = {}
 
     def __call__(
         self,
         target: parametertools.Parameter,
     ) -> None:
-        ref = target.subpars[self._reference]
+        ref = self._target2reference.get(target)
+        if ref is None:
+            ref = target.subpars[self._reference]
+            self._target2reference[target] = ref
         if self._mask:
             mask = ref.get_submask(self._mask)
-            values = ref.values[mask] if ref.NDIM else ref.value
-            target.values[mask] = self._rule.value * values
+            if ref.NDIM:
+                numpy.multiply(
+                    ref.values,
+                    self._rule.value,
+                    out=target.values,
+                    where=numpy.asarray(mask),
+                )
+            else:
+                target.values[mask] = self._rule.value * ref.value
         else:
             target.value = self._rule.value * ref.value
 
@@ -576,6 +638,11 @@ the following error occurred: Object `Selections("headwaters", \
     _model: Optional[str]
     _parameterstep: Optional[timetools.Period]
     _original_parameter_values: Tuple[Union[float, numpy.ndarray], ...]
+    _stacked_original_values: Optional[
+        Tuple[numpy.ndarray, Tuple[Tuple[slice, Tuple[int, ...]], ...]]
+    ]
+    _parameters: Tuple[parametertools.Parameter, ...]
+    _plaincall: bool
 
     def __init__(
         self,
@@ -602,43 +669,48 @@ the following error occurred: Object `Selections("headwaters", \
             if selections is None:
                 selections = hydpy.pub.selections
                 if "complete" in selections:
-                    selections = selectiontools.Selections(selections.complete)
-            else:
-                selections = selectiontools.Selections(
-                    *(
-                        sel
-                        if isinstance(sel, selectiontools.Selection)
-                        else hydpy.pub.selections[sel]
-                        for sel in selections
-                    )
-                )
-            self.selections = selections.names
+                    selections = (selections.complete,)
+            name2selection: Dict[str, selectiontools.Selection] = {}
+            for selection in selections:
+                if not isinstance(selection, selectiontools.Selection):
+                    selection = hydpy.pub.selections[selection]
+                name2selection[selection.name] = selection
+            self.selections = tuple(name2selection.keys())
+            elements = itertools.chain.from_iterable(
+                selection.elements for selection in name2selection.values()
+            )
             if self._model is None:
-                self.elements = selections.elements
+                self.elements = devicetools.Elements(elements)
             else:
                 self.elements = devicetools.Elements(
-                    element
-                    for element in selections.elements
-                    if str(element.model) == self._model
+                    element for element in elements if str(element.model) == self._model
                 )
             if not self.elements:
                 raise ValueError(
-                    f"Object `{selections}` does not handle "
-                    f"any `{self._model}` model instances."
+                    f"Object `{selectiontools.Selections(*name2selection.values())}` "
+                    f"does not handle any `{self._model}` model instances."
                 )
             for element in self.elements:
-                control = element.model.parameters.control
-                if not hasattr(control, self.parametername):
+                if self.parametername not in _get_controlparameternames(element.model):
                     raise RuntimeError(
                         f"Model {objecttools.elementphrase(element.model)} "
                         f"does not define a control parameter named "
                         f"`{self.parametername}`."
                     )
-            self.parametertype = type(
-                tuple(self.elements)[0].model.parameters.control[self.parametername]
+            self._parameters = tuple(
+                getattr(element.model.parameters.control, self.parametername)
+                for element in self.elements
+            )
+            self.parametertype = type(self._parameters[0])
+            # Shortcuts for assigning values are only safe if all target
+            # parameters are of the same type (with the same `TIME` value)
+            # and if this type does not override the standard `__call__`:
+            self._plaincall = (self.parametertype.__call__ in _PLAIN_CALLS) and all(
+                type(parameter) is self.parametertype for parameter in self._parameters
             )
             self.parameterstep = parameterstep
             self._original_parameter_values = self._get_original_parameter_values()
+            self._stacked_original_values = None
         except BaseException:
             objecttools.augment_excmessage(
                 f"While trying to initialise the `{type(self).__name__}` "
@@ -648,8 +720,7 @@ the following error occurred: Object `Selections("headwaters", \
     def _get_original_parameter_values(
         self,
     ) -> Tuple[Union[float, numpy.ndarray], ...]:
-        # pylint: disable=not-callable
-        with hydpy.pub.options.parameterstep(self.parameterstep):
+        with self._get_parameterstep_context():
             return tuple(par.revert_timefactor(par.value) for par in self)
 
     @property
@@ -695,16 +766,22 @@ Applying the trimmed value `200.0` instead.
         self,
         value: float,
     ) -> None:
-        if self.lower <= value <= self.upper:
+        lower, upper = self.lower, self.upper
+        if lower <= value <= upper:
             self._value = value
         else:
-            self._value = min(max(value, self.lower), self.upper)
+            if value < lower:
+                self._value = lower
+            elif value > upper:
+                self._value = upper
+            else:
+                self._value = value
             if hydpy.pub.options.warntrim:
                 repr_ = objecttools.repr_
                 warnings.warn(
                     f"The value of the `{type(self).__name__}` object "
-                    f"`{self}` must not be smaller than `{repr_(self.lower)}` "
-                    f"or larger than `{repr_(self.upper)}`, but the "
+                    f"`{self}` must not be smaller than `{repr_(lower)}` "
+                    f"or larger than `{repr_(upper)}`, but the "
                     f"given value is `{repr_(value)}`.  Applying the trimmed "
                     f"value `{repr_(self._value)}` instead."
                 )
@@ -737,11 +814,24 @@ Applying the trimmed value `200.0` instead.
         >>> rule.reset_parameters()
         >>> fc
         fc(206.0)
+
+        Method |Rule.reset_parameters| only assigns the original values to
+        parameters that do not already hold them:
+
+        >>> from unittest import mock
+        >>> with mock.patch.object(type(fc), "__call__") as call:
+        ...     rule.reset_parameters()
+        >>> call.called
+        False
         """
-        # pylint: disable=not-callable
-        with hydpy.pub.options.parameterstep(self.parameterstep):
-            for parameter, orig in zip(self, self._original_parameter_values):
-                parameter(orig)
+        # the original values are floats or arrays, depending on `NDIM`:
+        origs: Tuple[Any, ...] = self._original_parameter_values
+        with self._get_parameterstep_context():
+            for parameter, orig in zip(self, origs):
+                if not numpy.array_equal(
+                    parameter.values, parameter.apply_timefactor(orig)
+                ):
+                    parameter(orig)
 
     def _get_parameterstep(self) -> Optional[timetools.Period]:
         """The parameter step size relevant to the related model parameter.
@@ -773,6 +863,52 @@ Applying the trimmed value `200.0` instead.
 
     parameterstep = property(_get_parameterstep, _set_parameterstep)
 
+    def _get_parameterstep_context(self) -> ContextManager[Any]:
+        """Return a context manager setting the |Options.parameterstep| of
+        the actual |Rule| object or, if it has none, a dummy context manager
+        so that time-independent parameters avoid touching the options."""
+        if self._parameterstep is None:
+            return _NULLCONTEXT
+        # pylint: disable=not-callable
+        return hydpy.pub.options.parameterstep(self._parameterstep)
+
+    def _apply_to_original_values(
+        self,
+        operator_: Callable[[Any, Any], Any],
+    ) -> None:
+        """Combine the current calibration value with all original parameter
+        values via the given operator and apply the results (used by |Add|
+        and |Multiply|)."""
+        value = self.value
+        with self._get_parameterstep_context():
+            if not self._plaincall:
+                for parameter, orig in zip(self, self._original_parameter_values):
+                    parameter(operator_(value, orig))
+                return
+            # see method `Replace.apply_value`:
+            apply_timefactor = self.parametertype.apply_timefactor
+            if not self.parametertype.NDIM:
+                for parameter, orig in zip(self, self._original_parameter_values):
+                    parameter.values = apply_timefactor(operator_(value, orig))
+                    parameter.trim()
+                return
+            # For array parameters, a single operation on one concatenated
+            # array is much faster than one operation per parameter:
+            if self._stacked_original_values is None:
+                origs = self._original_parameter_values
+                stacked = numpy.concatenate([numpy.ravel(orig) for orig in origs])
+                slices, idx0 = [], 0
+                for orig in origs:
+                    idx1 = idx0 + numpy.size(orig)
+                    slices.append((slice(idx0, idx1), numpy.shape(orig)))
+                    idx0 = idx1
+                self._stacked_original_values = stacked, tuple(slices)
+            stacked, slices_ = self._stacked_original_values
+            results = apply_timefactor(operator_(value, stacked))
+            for parameter, (slice_, shape) in zip(self, slices_):
+                parameter.values = results[slice_].reshape(shape)
+                parameter.trim()
+
     def assignrepr(
         self,
         prefix: str,
@@ -810,11 +946,7 @@ Applying the trimmed value `200.0` instead.
         return self.name
 
     def __iter__(self) -> Iterator[parametertools.Parameter]:
-        for element in self.elements:
-            yield getattr(
-                element.model.parameters.control,
-                self.parametername,
-            )
+        return iter(self._parameters)
 
 
 class Replace(Rule):
@@ -837,13 +969,23 @@ class Replace(Rule):
 
         See the documentation on class |Rule| for further information.
         """
-        # pylint: disable=not-callable
-        with hydpy.pub.options.parameterstep(self.parameterstep):
-            for parameter in self:
-                if self.adaptor:
-                    self.adaptor(parameter)
-                else:
-                    parameter(self.value)
+        adaptor = self.adaptor
+        with self._get_parameterstep_context():
+            if adaptor:
+                for parameter in self:
+                    adaptor(parameter)
+            elif self._plaincall:
+                # All target parameters are of the same type, so we can apply
+                # the time factor once and skip the argument handling of
+                # `__call__`, which adds nothing for a single scalar value:
+                value = self.parametertype.apply_timefactor(self.value)
+                for parameter in self:
+                    parameter.values = value
+                    parameter.trim()
+            else:
+                value = self.value
+                for parameter in self:
+                    parameter(value)
 
 
 class Add(Rule):
@@ -898,10 +1040,7 @@ class Add(Rule):
     def apply_value(self) -> None:
         """Apply the current (adapted) value on the relevant |Parameter|
         objects."""
-        # pylint: disable=not-callable
-        with hydpy.pub.options.parameterstep(self.parameterstep):
-            for parameter, orig in zip(self, self._original_parameter_values):
-                parameter(self.value + orig)
+        self._apply_to_original_values(operator.add)
 
 
 class Multiply(Rule):
@@ -955,10 +1094,7 @@ class Multiply(Rule):
     def apply_value(self) -> None:
         """Apply the current (adapted) value on the relevant |Parameter|
         objects."""
-        # pylint: disable=not-callable
-        with hydpy.pub.options.parameterstep(self.parameterstep):
-            for parameter, orig in zip(self, self._original_parameter_values):
-                parameter(self.value * orig)
+        self._apply_to_original_values(operator.mul)
 
 
 class CalibrationInterface(Generic[RuleType1]):
@@ -1418,7 +1554,8 @@ interface (damp and fc) do not agree with the names in the header of logfile \
     _hp: hydpytools.HydPy
     _targetfunction: TargetFunction
     _rules: Dict[str, RuleType1]
-    _elements: devicetools.Elements
+    _ruleids: Set[int]
+    _elements: Set[devicetools.Element]
 
     def __init__(
         self,
@@ -1429,7 +1566,8 @@ interface (damp and fc) do not agree with the names in the header of logfile \
         self._targetfunction = targetfunction
         self.conditions = hp.conditions
         self._rules = {}
-        self._elements = devicetools.Elements()
+        self._ruleids = set()
+        self._elements = set()
         self._logfilepath = None
         self.result = None
 
@@ -1479,9 +1617,21 @@ interface (damp and fc) do not agree with the names in the header of logfile \
         >>> len(ci._elements)
         7
         """
+        dict_ = vars(self)
         for rule in rules:
-            self._rules[rule.name] = rule
-            self._update_elements_when_adding_a_rule(rule)
+            name = rule.name
+            old = self._rules.get(name)
+            self._rules[name] = rule
+            if old is not None:
+                self._ruleids.discard(id(old))
+            self._ruleids.add(id(rule))
+            # For fast attribute access, we store each rule also as a normal
+            # attribute, as long as this does not hide any other attribute:
+            if (
+                (name not in dict_) or ((old is not None) and (dict_[name] is old))
+            ) and not hasattr(type(self), name):
+                dict_[name] = rule
+        self._update_elements_when_adding_rules(rules)
 
     @overload
     def get_rule(
@@ -1610,6 +1760,11 @@ object named `fc` of type `Add`.
         False
         >>> "damp" in ci
         False
+        >>> ci.damp
+        Traceback (most recent call last):
+        ...
+        AttributeError: The actual calibration interface does neither handle a \
+normal attribute nor a rule object named `damp`.
         >>> len(ci._elements)
         4
 
@@ -1621,15 +1776,19 @@ object named `fc` of type `Add`.
         RuntimeError: The actual calibration interface object does not handle \
 a rule object named `fc`.
         """
+        dict_ = vars(self)
         for rule in rules:
-            rulename = getattr(rule, "name", rule)
+            rulename = str(getattr(rule, "name", rule))
             try:
-                del self._rules[rulename]
+                rule_ = self._rules.pop(rulename)
             except KeyError:
                 raise RuntimeError(
                     f"The actual calibration interface object does "
                     f"not handle a rule object named `{rulename}`."
                 ) from None
+            self._ruleids.discard(id(rule_))
+            if dict_.get(rulename) is rule_:
+                del dict_[rulename]
         self._update_elements_when_deleting_a_rule()
 
     @overload
@@ -1903,12 +2062,13 @@ objects via argument `selections`.
                 lowers = calibspecs.lowers
             if uppers is None:
                 uppers = calibspecs.uppers
-        parameters_ = tuple(
-            objecttools.extract(
-                values=parameters,
-                types_=(parametertools.Parameter, str),
-            )
-        )
+        types_ = (parametertools.Parameter, str)
+        if isinstance(parameters, (tuple, list)) and all(
+            isinstance(parameter, types_) for parameter in parameters
+        ):
+            parameters_ = tuple(parameters)
+        else:
+            parameters_ = tuple(objecttools.extract(values=parameters, types_=types_))
         # pylint: disable=isinstance-second-argument-not-valid-type
         # see https://github.com/PyCQA/pylint/issues/3507
         if isinstance(parametersteps, str) or not isinstance(parametersteps, Sequence):
@@ -1951,10 +2111,11 @@ objects via argument `selections`.
             )
         else:
             selections2 = itertools.repeat(selections, nmb_parameters)
+        newrules = []
         for name, parameter, lower, upper, value, parameterstep, selections_ in zip(
             names, parameters_, lowers, uppers, values, parametersteps, selections2
         ):
-            self.add_rules(
+            newrules.append(
                 rule(
                     name=name,
                     parameter=parameter,
@@ -1966,6 +2127,7 @@ objects via argument `selections`.
                     model=model,
                 )
             )
+        self.add_rules(*newrules)
 
     def prepare_logfile(
         self,
@@ -2005,12 +2167,13 @@ objects via argument `selections`.
         further information.
         """
         if self._logfilepath:
+            repr_ = objecttools.repr_
+            digits = hydpy.pub.options.reprdigits
+            line = "\t".join(
+                [repr_(self.result, digits)] + [repr_(v, digits) for v in self.values]
+            )
             with open(self._logfilepath, "a") as logfile:
-                logfile.write(f"{objecttools.repr_(self.result)}\t")
-                logfile.write(
-                    "\t".join(objecttools.repr_(value) for value in self.values)
-                )
-                logfile.write("\n")
+                logfile.write(f"{line}\n")
 
     def read_logfile(
         self,
@@ -2026,14 +2189,32 @@ objects via argument `selections`.
         with open(logfilepath) as logfile:
             # pylint: disable=not-an-iterable
             # because pylint is wrong!?
-            lines = tuple(
+            lines = (
                 line for line in logfile if line.strip() and (not line.startswith("#"))
             )
             # pylint: disable=not-an-iterable
+            line_names = next(lines)
+            line_steps = next(lines)
+            # we only keep the best line to avoid loading the whole file
+            # and only split the first column for comparing the results:
+            line_first = next(lines)
+            worst = -numpy.inf if maximisation else numpy.inf
+            better = operator.gt if maximisation else operator.lt
+            scored = (
+                (float(line.split(None, 1)[0]), line)
+                for line in itertools.chain((line_first,), lines)
+            )
+            # (`better` also filters `nan` values, which confuse `max` and `min`)
+            candidates = (item for item in scored if better(item[0], worst))
+            result_best, line_best = (max if maximisation else min)(
+                candidates,
+                key=operator.itemgetter(0),
+                default=(worst, line_first),
+            )
         idx2name, idx2rule = {}, {}
         parameterstep: Optional[Union[str, timetools.Period]]
         for idx, (name, parameterstep) in enumerate(
-            zip(lines[0].split()[1:], lines[1].split()[1:]),
+            zip(line_names.split()[1:], line_steps.split()[1:]),
         ):
             if name in self._rules:
                 rule = self._rules[name]
@@ -2062,31 +2243,23 @@ objects via argument `selections`.
                     f"with the names in the header of logfile "
                     f"`{self._logfilepath}` ({enumeration(sorted(names_ext))})."
                 )
-        jdx_best = 0
-        result_best = -numpy.inf if maximisation else numpy.inf
-        for jdx, line in enumerate(lines[2:]):
-            result = float(line.split()[0])
-            if (maximisation and (result > result_best)) or (
-                (not maximisation) and (result < result_best)
-            ):
-                jdx_best = jdx
-                result_best = result
-
-        for idx, value in enumerate(lines[jdx_best + 2].split()[1:]):
-            if idx in idx2rule:
-                idx2rule[idx].value = float(value)
+        tokens = line_best.split()
+        for idx, rule in idx2rule.items():
+            rule.value = float(tokens[idx + 1])
         self.result = result_best
 
-    def _update_elements_when_adding_a_rule(
+    def _update_elements_when_adding_rules(
         self,
-        rule: Rule,
+        rules: Iterable[Rule],
     ) -> None:
-        self._elements += rule.elements
+        self._elements.update(
+            itertools.chain.from_iterable(rule.elements for rule in rules)
+        )
 
     def _update_elements_when_deleting_a_rule(self) -> None:
-        self._elements = devicetools.Elements()
-        for rule in self:
-            self._elements += rule.elements
+        self._elements = set(
+            itertools.chain.from_iterable(rule.elements for rule in self)
+        )
 
     @property
     def names(self) -> Tuple[str, ...]:
@@ -2095,7 +2268,7 @@ objects via argument `selections`.
         See the main documentation on class |CalibrationInterface| for
         further information.
         """
-        return tuple(rule.name for rule in self)
+        return tuple([rule.name for rule in self._rules.values()])
 
     @property
     def values(self) -> Tuple[float, ...]:
@@ -2104,7 +2277,7 @@ objects via argument `selections`.
         See the main documentation on class |CalibrationInterface| for
         further information.
         """
-        return tuple(rule.value for rule in self)
+        return tuple([rule.value for rule in self._rules.values()])
 
     @property
     def lowers(self) -> Tuple[float, ...]:
@@ -2113,7 +2286,7 @@ objects via argument `selections`.
         See the main documentation on class |CalibrationInterface| for
         further information.
         """
-        return tuple(rule.lower for rule in self)
+        return tuple([rule.lower for rule in self._rules.values()])
 
     @property
     def uppers(self) -> Tuple[float, ...]:
@@ -2122,7 +2295,7 @@ objects via argument `selections`.
         See the main documentation on class |CalibrationInterface| for
         further information.
         """
-        return tuple(rule.upper for rule in self)
+        return tuple([rule.upper for rule in self._rules.values()])
 
     @property
     def selections(self) -> Tuple[str, ...]:
@@ -2150,8 +2323,18 @@ objects via argument `selections`.
         self,
         values: Iterable[float],
     ) -> None:
-        for rule, value in zip(self, values):
-            rule.value = value
+        # pylint: disable=protected-access
+        values_ = numpy.fromiter(values, dtype=float).tolist()
+        value_property = Rule.value
+        for rule, value in zip(self._rules.values(), values_):
+            # Values within the boundaries need no trimming, so we can skip
+            # the property (unless a subclass overrides it):
+            if (type(rule).value is value_property) and (
+                rule.lower <= value <= rule.upper
+            ):
+                rule._value = value
+            else:
+                rule.value = value
 
     def _refresh_hp(self) -> None:
         for element in self._elements:
@@ -2361,8 +2544,7 @@ parameterstep="1d"
         return len(self._rules)
 
     def __iter__(self) -> Iterator[RuleType1]:
-        for rule in self._rules.values():
-            yield rule
+        return iter(self._rules.values())
 
     def __getattr__(self, item: str) -> RuleType1:
         try:
@@ -2383,10 +2565,12 @@ parameterstep="1d"
             ) from None
 
     def __contains__(self, item: Union[str, Rule]) -> bool:
-        return (item in self._rules) or (item in self._rules.values())
+        if isinstance(item, str):
+            return item in self._rules
+        return id(item) in self._ruleids
 
     def __repr__(self) -> str:
-        return "\n".join(repr(rule) for rule in self)
+        return "\n".join([repr(rule) for rule in self._rules.values()])
 
     def __str__(self) -> str:
         return objecttools.classname(self)
@@ -2418,7 +2602,7 @@ parameterstep="1d"
 'remove_rules', 'reset_parameters', 'result', 'selections', 'update_logfile', \
 'uppers', 'values']
         """
-        return objecttools.dir_(self) + list(self._rules.keys())
+        return list(set(objecttools.dir_(self)).union(self._rules.keys()))
 
 
 class ReplaceIUH(Rule):
@@ -2569,6 +2753,7 @@ agree with the complete set of relevant elements (element1 and element2).
     one handles the same elements and is applied afterwards.
     """
     _element2iuh: Optional[Dict[str, iuhtools.IUH]] = None
+    _iuhs: Tuple[iuhtools.IUH, ...] = ()
 
     def _get_original_parameter_values(
         self,
@@ -2587,30 +2772,26 @@ agree with the complete set of relevant elements (element1 and element2).
         information.
         """
         try:
-            names_int = set(self.elements.names)
-            names_ext = set(iuhs.keys())
+            # both name collections are free of duplicates:
+            names_int = sorted(self.elements.names)
+            names_ext = sorted(iuhs.keys())
             if names_int != names_ext:
                 enumeration = objecttools.enumeration
                 raise RuntimeError(
-                    f"The given elements ({enumeration(sorted(names_ext))}) "
+                    f"The given elements ({enumeration(names_ext)}) "
                     f"do not agree with the complete set of relevant "
-                    f"elements ({enumeration(sorted(names_int))})."
+                    f"elements ({enumeration(names_int)})."
                 )
             element2iuh = self._element2iuh = {}
             for element in self.elements:
                 element2iuh[element.name] = iuhs[element.name]
+            self._iuhs = tuple(element2iuh.values())
         except BaseException:
             objecttools.augment_excmessage(
                 f"While trying to add `IUH` objects to the "
                 f"`{type(self).__name__}` rule `{self}`"
             )
 
-    @property
-    def _iuhs(self) -> Iterable[iuhtools.IUH]:
-        element2iuh = {} if self._element2iuh is None else self._element2iuh
-        for iuh in element2iuh.values():
-            yield iuh
-
     def apply_value(self) -> None:
         """Apply all current calibration parameter values on all relevant
         |IUH| objects and eventually update the ARMA coefficients of the
@@ -2619,19 +2800,23 @@ agree with the complete set of relevant elements (element1 and element2).
         See the main documentation on class |CalibrationInterface| for
         further information.
         """
-        for parameter, iuh in zip(self, self._iuhs):
-            # entries = self.name.split("_")
-            # name = entries[0]
-            # threshold = "_".join(entries[1:])
-            # setattr(iuh, self.name, self.value)
-            # if self.update_parameters:
-            #     try:
-            #         parameter(iuh.arma.coefs)
-            #     except RuntimeError:
-            #         parameter(((), iuh.ma.coefs))
-            setattr(iuh, self.name, self.value)
-            if self.update_parameters:
+        # entries = self.name.split("_")
+        # name = entries[0]
+        # threshold = "_".join(entries[1:])
+        # setattr(iuh, self.name, self.value)
+        # if self.update_parameters:
+        #     try:
+        #         parameter(iuh.arma.coefs)
+        #     except RuntimeError:
+        #         parameter(((), iuh.ma.coefs))
+        name, value = self.name, self.value
+        if self.update_parameters:
+            for parameter, iuh in zip(self, self._iuhs):
+                setattr(iuh, name, value)
                 parameter(iuh.arma.coefs)
+        else:
+            for iuh in self._iuhs:
+                setattr(iuh, name, value)
 
     def reset_parameters(self) -> None:
         """Reset all relevant parameter objects to their original states.
@@ -2701,6 +2886,8 @@ parameterstep="1d"
     See the documentation on class |CalibSpecs| for further information.
     """
 
+    __slots__ = ("name", "default", "lower", "upper", "parameterstep")
+
     name: str
     """Name of the calibration parameter."""
     default: float
@@ -2834,6 +3021,8 @@ object named `second`.
     third
     """
 
+    __slots__ = ("_name2parspec",)
+
     _name2parspec: Dict[str, CalibSpec]
 
     def __init__(
@@ -2885,8 +3074,7 @@ object named `second`.
         return len(self._name2parspec)
 
     def __iter__(self) -> Iterator[CalibSpec]:
-        for value in self._name2parspec.values():
-            yield value
+        return iter(self._name2parspec.values())
 
     def append(self, *calibspecs: CalibSpec) -> None:
         """Append one or more |CalibSpec| objects.
@@ -2925,7 +3113,7 @@ parameterstep="1d"),
         >>> calibspecs.names
         ('first', 'second', 'third')
         """
-        return tuple(parspec.name for parspec in self._name2parspec.values())
+        return tuple([parspec.name for parspec in self._name2parspec.values()])
 
     @property
     def defaults(self) -> Tuple[float, ...]:
@@ -2941,7 +3129,7 @@ parameterstep="1d"),
         >>> calibspecs.defaults
         (1.0, 2.0, 3.0)
         """
-        return tuple(parspec.default for parspec in self._name2parspec.values())
+        return tuple([parspec.default for parspec in self._name2parspec.values()])
 
     @property
     def lowers(self) -> Tuple[float, ...]:
@@ -2958,7 +3146,7 @@ parameterstep="1d"),
         >>> calibspecs.lowers
         (0.0, -inf, -10.0)
         """
-        return tuple(parspec.lower for parspec in self._name2parspec.values())
+        return tuple([parspec.lower for parspec in self._name2parspec.values()])
 
     @property
     def uppers(self) -> Tuple[float, ...]:
@@ -2975,7 +3163,7 @@ parameterstep="1d"),
         >>> calibspecs.uppers
         (inf, 2.0, 10.0)
         """
-        return tuple(parspec.upper for parspec in self._name2parspec.values())
+        return tuple([parspec.upper for parspec in self._name2parspec.values()])
 
     @property
     def parametersteps(self) -> Tuple[Optional[timetools.Period], ...]:
@@ -2991,7 +3179,7 @@ parameterstep="1d"),
         >>> calibspecs.parametersteps
         (None, None, Period("1d"))
         """
-        return tuple(parspec.parameterstep for parspec in self._name2parspec.values())
+        return tuple([parspec.parameterstep for parspec in self._name2parspec.values()])
 
     def __str__(self) -> str:
         arguments = (f'"{name}"' for name in self._name2parspec.keys())
@@ -3014,11 +3202,11 @@ parameterstep="1d"),
         ...                         CalibSpec(name="second",default=2.0))
         >>> print_values(dir(calibspecs))
         __annotations__, __class__, __contains__, __delattr__, __delitem__,
-        __dict__, __dir__, __doc__, __eq__, __format__, __ge__, __getattr__,
+        __dir__, __doc__, __eq__, __format__, __ge__, __getattr__,
         __getattribute__, __getitem__, __gt__, __hash__, __init__,
         __init_subclass__, __iter__, __le__, __len__, __lt__, __module__,
         __ne__, __new__, __reduce__, __reduce_ex__, __repr__, __setattr__,
-        __sizeof__, __str__, __subclasshook__, __weakref__, _name2parspec,
+        __sizeof__, __slots__, __str__, __subclasshook__, _name2parspec,
         append, defaults, first, lowers, names, parametersteps, second, uppers
         """
         return list(super().__dir__()) + list(self.names)
@@ -67,13 +67,15 @@ class PrimaryParameterIUH(ParameterIUH):
     functions to be defined by the user.
 
     When a primary parameter value is set or deleted, the master instance is
-    instructed to |IUH.update| all secondary parameter values.
+    instructed to |IUH.update| all secondary parameter values.  Setting a
+    primary parameter to its current value does not trigger an update.
     """
 
     def __set__(self, obj, value):
         value = self._convert_type(value)
-        setattr(obj, self._name, value)
-        obj.update()
+        if value != getattr(obj, self._name, None):
+            setattr(obj, self._name, value)
+            obj.update()
 
     def __delete__(self, obj):
         setattr(obj, self._name, None)
@@ -369,6 +371,15 @@ class TranslationDiffusionEquation(IUH):
     >>> tde.arma.order
     (4, 5)
 
+    Assigning the current value again keeps the already determined
+    coefficients (which is convenient when calibrating multiple primary
+    parameters one by one, see class |ReplaceIUH|):
+
+    >>> ar_coefs = tde.arma.ar_coefs
+    >>> tde.x = 5.0
+    >>> tde.arma.ar_coefs is ar_coefs
+    True
+
     As long as the primary parameter values are incomplete, no secondary
     parameter values are available:
 
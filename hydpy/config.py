@@ -21,3 +21,11 @@ PROFILECYTHON = False
 """A flag which indicates if cythonized models should be fully accessible 
 during profiling.  Setting this flag to True decreases performance and 
 should be done my model or framework developers only."""
+
+NATIVECYTHON = False
+"""A flag which indicates whether the C compiler should optimise cythonized 
+models for the processor of the current computer (on GCC-compatible 
+compilers via the options `-O3` and `-march=native`).  Setting this flag to 
+True might increase performance but results in binaries that are not 
+portable, meaning the compiled models might crash on computers with other 
+processors.  The flags are skipped for MSVC, which does not support them."""
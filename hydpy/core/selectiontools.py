@@ -436,6 +436,8 @@ Selections objects, single Selection objects, or iterables containing \
         self,
         value: Union[str, "Selection"],
     ) -> bool:
+        if isinstance(value, str):
+            return value in self.__selections
         try:
             return value in self.__selections.values()
         except AttributeError:
@@ -20,7 +20,10 @@ method of class |ELSModel|, used for deriving the |test| model.  By
 now, we did only implement 0-dimensional and 1-dimensional sequences
 requiring this method.  After hackishly changing the dimensionality of
 sequences |test_states.S|, we still seem to get  plausible results, but
-these are untested in model applications:
+these are untested in model applications.  Note that, with the
+configuration flag "FASTCYTHON" being |True|, the generated code copies
+the values of 1-dimensional and 2-dimensional sequences at once via
+`memcpy`:
 
 >>> from hydpy.models.test import cythonizer
 >>> pyxwriter = cythonizer.pyxwriter
@@ -30,9 +33,9 @@ these are untested in model applications:
         cdef int idx0
         self.sequences.states.s = \
 self.sequences.states._s_points[self.numvars.idx_stage]
-        for idx0 in range(self.sequences.states._sv_length):
-            self.sequences.states.sv[idx0] = \
-self.sequences.states._sv_points[self.numvars.idx_stage][idx0]
+        memcpy(&self.sequences.states.sv[0], \
+&self.sequences.states._sv_points[self.numvars.idx_stage, 0], \
+self.sequences.states._sv_length * sizeof(double))
 <BLANKLINE>
 
 
@@ -41,13 +44,12 @@ self.sequences.states._sv_points[self.numvars.idx_stage][idx0]
             . get_point_states
     cpdef inline void get_point_states(self) nogil:
         cdef int idx0, idx1
-        for idx0 in range(self.sequences.states._s_length0):
-            for idx1 in range(self.sequences.states._s_length1):
-                self.sequences.states.s[idx0, idx1] = \
-self.sequences.states._s_points[self.numvars.idx_stage][idx0, idx1]
-        for idx0 in range(self.sequences.states._sv_length):
-            self.sequences.states.sv[idx0] = \
-self.sequences.states._sv_points[self.numvars.idx_stage][idx0]
+        memcpy(&self.sequences.states.s[0, 0], \
+&self.sequences.states._s_points[self.numvars.idx_stage, 0, 0], \
+self.sequences.states._s_length * sizeof(double))
+        memcpy(&self.sequences.states.sv[0], \
+&self.sequences.states._sv_points[self.numvars.idx_stage, 0], \
+self.sequences.states._sv_length * sizeof(double))
 <BLANKLINE>
 
 >>> pyxwriter.model.sequences.states.s.NDIM = 3
@@ -64,6 +66,7 @@ We start with the method |ELSModel.integrate_fluxes|:
             . integrate_fluxes
     cpdef inline void integrate_fluxes(self) nogil:
         cdef int jdx, idx0
+        cdef double coef
         self.sequences.fluxes.q = 0.
         for jdx in range(self.numvars.idx_method):
             self.sequences.fluxes.q = \
@@ -72,11 +75,12 @@ self.numconsts.a_coefs[self.numvars.idx_method-1, \
 self.numvars.idx_stage, jdx]*self.sequences.fluxes._q_points[jdx]
         for idx0 in range(self.sequences.fluxes._qv_length):
             self.sequences.fluxes.qv[idx0] = 0.
-            for jdx in range(self.numvars.idx_method):
+        for jdx in range(self.numvars.idx_method):
+            coef = self.numvars.dt * \
+self.numconsts.a_coefs[self.numvars.idx_method-1, self.numvars.idx_stage, jdx]
+            for idx0 in range(self.sequences.fluxes._qv_length):
                 self.sequences.fluxes.qv[idx0] = \
-self.sequences.fluxes.qv[idx0] + self.numvars.dt * \
-self.numconsts.a_coefs[self.numvars.idx_method-1, self.numvars.idx_stage, jdx]*\
-self.sequences.fluxes._qv_points[jdx, idx0]
+self.sequences.fluxes.qv[idx0] + coef*self.sequences.fluxes._qv_points[jdx, idx0]
 <BLANKLINE>
 
 
@@ -85,21 +89,26 @@ self.sequences.fluxes._qv_points[jdx, idx0]
             . integrate_fluxes
     cpdef inline void integrate_fluxes(self) nogil:
         cdef int jdx, idx0, idx1
+        cdef double coef
         for idx0 in range(self.sequences.fluxes._q_length0):
             for idx1 in range(self.sequences.fluxes._q_length1):
                 self.sequences.fluxes.q[idx0, idx1] = 0.
-                for jdx in range(self.numvars.idx_method):
+        for jdx in range(self.numvars.idx_method):
+            coef = self.numvars.dt * \
+self.numconsts.a_coefs[self.numvars.idx_method-1, self.numvars.idx_stage, jdx]
+            for idx0 in range(self.sequences.fluxes._q_length0):
+                for idx1 in range(self.sequences.fluxes._q_length1):
                     self.sequences.fluxes.q[idx0, idx1] = \
-self.sequences.fluxes.q[idx0, idx1] + self.numvars.dt * \
-self.numconsts.a_coefs[self.numvars.idx_method-1, self.numvars.idx_stage, jdx]*\
-self.sequences.fluxes._q_points[jdx, idx0, idx1]
+self.sequences.fluxes.q[idx0, idx1] + \
+coef*self.sequences.fluxes._q_points[jdx, idx0, idx1]
         for idx0 in range(self.sequences.fluxes._qv_length):
             self.sequences.fluxes.qv[idx0] = 0.
-            for jdx in range(self.numvars.idx_method):
+        for jdx in range(self.numvars.idx_method):
+            coef = self.numvars.dt * \
+self.numconsts.a_coefs[self.numvars.idx_method-1, self.numvars.idx_stage, jdx]
+            for idx0 in range(self.sequences.fluxes._qv_length):
                 self.sequences.fluxes.qv[idx0] = \
-self.sequences.fluxes.qv[idx0] + self.numvars.dt * \
-self.numconsts.a_coefs[self.numvars.idx_method-1, self.numvars.idx_stage, jdx]\
-*self.sequences.fluxes._qv_points[jdx, idx0]
+self.sequences.fluxes.qv[idx0] + coef*self.sequences.fluxes._qv_points[jdx, idx0]
 <BLANKLINE>
 
 >>> pyxwriter.model.sequences.fluxes.q.NDIM = 3
@@ -116,8 +125,8 @@ Method |ELSModel.reset_sum_fluxes|:
     cpdef inline void reset_sum_fluxes(self) nogil:
         cdef int idx0
         self.sequences.fluxes._q_sum = 0.
-        for idx0 in range(self.sequences.fluxes._qv_length):
-            self.sequences.fluxes._qv_sum[idx0] = 0.
+        memset(&self.sequences.fluxes._qv_sum[0], 0, \
+self.sequences.fluxes._qv_length * sizeof(double))
 <BLANKLINE>
 
 >>> pyxwriter.model.sequences.fluxes.q.NDIM = 2
@@ -128,8 +137,8 @@ Method |ELSModel.reset_sum_fluxes|:
         for idx0 in range(self.sequences.fluxes._q_length0):
             for idx1 in range(self.sequences.fluxes._q_length1):
                 self.sequences.fluxes._q_sum[idx0, idx1] = 0.
-        for idx0 in range(self.sequences.fluxes._qv_length):
-            self.sequences.fluxes._qv_sum[idx0] = 0.
+        memset(&self.sequences.fluxes._qv_sum[0], 0, \
+self.sequences.fluxes._qv_length * sizeof(double))
 <BLANKLINE>
 
 >>> pyxwriter.model.sequences.fluxes.q.NDIM = 3
@@ -188,25 +197,25 @@ Method |ELSModel.calculate_error|:
         abserror = fabs(\
 self.sequences.fluxes._q_results[self.numvars.idx_method]-\
 self.sequences.fluxes._q_results[self.numvars.idx_method-1])
-        self.numvars.abserror = max(self.numvars.abserror, abserror)
+        self.numvars.abserror = fmax(self.numvars.abserror, abserror)
         if self.numvars.use_relerror:
             if self.sequences.fluxes._q_results[self.numvars.idx_method] == 0.:
                 self.numvars.relerror = inf
             else:
-                self.numvars.relerror = max(\
+                self.numvars.relerror = fmax(\
 self.numvars.relerror, \
 fabs(abserror/self.sequences.fluxes._q_results[self.numvars.idx_method]))
         for idx0 in range(self.sequences.fluxes._qv_length):
             abserror = fabs(\
 self.sequences.fluxes._qv_results[self.numvars.idx_method, idx0]-\
 self.sequences.fluxes._qv_results[self.numvars.idx_method-1, idx0])
-            self.numvars.abserror = max(self.numvars.abserror, abserror)
+            self.numvars.abserror = fmax(self.numvars.abserror, abserror)
             if self.numvars.use_relerror:
                 if self.sequences.fluxes._qv_results\
 [self.numvars.idx_method, idx0] == 0.:
                     self.numvars.relerror = inf
                 else:
-                    self.numvars.relerror = max(\
+                    self.numvars.relerror = fmax(\
 self.numvars.relerror, \
 fabs(abserror/self.sequences.fluxes._qv_results[self.numvars.idx_method, idx0]))
 <BLANKLINE>
@@ -227,26 +236,26 @@ fabs(abserror/self.sequences.fluxes._qv_results[self.numvars.idx_method, idx0]))
                 abserror = fabs(\
 self.sequences.fluxes._q_results[self.numvars.idx_method, idx0, idx1]-\
 self.sequences.fluxes._q_results[self.numvars.idx_method-1, idx0, idx1])
-                self.numvars.abserror = max(self.numvars.abserror, abserror)
+                self.numvars.abserror = fmax(self.numvars.abserror, abserror)
                 if self.numvars.use_relerror:
                     if self.sequences.fluxes._q_results\
 [self.numvars.idx_method, idx0, idx1] == 0.:
                         self.numvars.relerror = inf
                     else:
-                        self.numvars.relerror = max(\
+                        self.numvars.relerror = fmax(\
 self.numvars.relerror, fabs(\
 abserror/self.sequences.fluxes._q_results[self.numvars.idx_method, idx0, idx1]))
         for idx0 in range(self.sequences.fluxes._qv_length):
             abserror = fabs(\
 self.sequences.fluxes._qv_results[self.numvars.idx_method, idx0]-\
 self.sequences.fluxes._qv_results[self.numvars.idx_method-1, idx0])
-            self.numvars.abserror = max(self.numvars.abserror, abserror)
+            self.numvars.abserror = fmax(self.numvars.abserror, abserror)
             if self.numvars.use_relerror:
                 if self.sequences.fluxes._qv_results\
 [self.numvars.idx_method, idx0] == 0.:
                     self.numvars.relerror = inf
                 else:
-                    self.numvars.relerror = max(\
+                    self.numvars.relerror = fmax(\
 self.numvars.relerror, \
 fabs(abserror/self.sequences.fluxes._qv_results[self.numvars.idx_method, idx0]))
 <BLANKLINE>
@@ -259,18 +268,21 @@ NotImplementedError: NDIM of sequence `q` is higher than expected.
 """
 # import...
 # ...from standard library
-import copy
+import distutils.command.build_ext
 import distutils.core
 import distutils.extension
 
 # pylint: enable=no-name-in-module
 # pylint: enable=import-error
 import functools
+import glob
+import hashlib
 import importlib
 import inspect
 import math
 import os
 import platform
+import re
 import shutil
 import sys
 import types
@@ -300,8 +312,10 @@ from hydpy.core import testtools
 from hydpy.core import typingtools
 
 if TYPE_CHECKING:
+    import Cython
     import Cython.Build as build
 else:
+    Cython = exceptiontools.OptionalImport("Cython", ["Cython"], locals())
     build = exceptiontools.OptionalImport("build", ["Cython.Build"], locals())
 
 
@@ -350,9 +364,25 @@ with numpy's default integer type on the current platform/system.
 """
 
 NDIM2STR = {0: "", 1: "[:]", 2: "[:,:]", 3: "[:,:,:]"}
+NDIM2CONTIGUOUSSTR = {0: "", 1: "[::1]", 2: "[:,::1]", 3: "[:,:,::1]"}
 
 _nogil = " nogil" if config.FASTCYTHON else ""
 
+_BRACKETS_AND_LINEBREAKS = re.compile(r"([()\[\]{}\n])")
+_IMATH_OPERATORS = re.compile(r"\+=|-=|\*\*=|\*=|//=|/=|%=")
+
+
+class _BuildExt(distutils.command.build_ext.build_ext):
+    """Build command that adds the processor-specific optimisation flags
+    selected via option "NATIVECYTHON" if the compiler understands them
+    (MSVC does not)."""
+
+    def build_extensions(self) -> None:
+        if config.NATIVECYTHON and (self.compiler.compiler_type != "msvc"):
+            for extension in self.extensions:
+                extension.extra_compile_args.extend(["-O3", "-march=native"])
+        super().build_extensions()
+
 
 class Lines(list):
     """Handles code lines for `.pyx` file."""
@@ -364,11 +394,11 @@ class Lines(list):
         """Append the given text line with prefixed spaces following
         the given number of indentation levels.
         """
+        prefix = indent * "    "
         if isinstance(line, str):
-            list.append(self, indent * 4 * " " + line)
+            list.append(self, prefix + line)
         else:
-            for subline in line:
-                list.append(self, indent * 4 * " " + subline)
+            list.extend(self, [prefix + subline for subline in line])
 
     def __repr__(self):
         return "\n".join(self) + "\n"
@@ -428,6 +458,7 @@ class Cythonizer:
 
     def __init__(self):
         self._cymodule = None
+        self._pysourcefiles: Dict[str, Tuple[str, ...]] = {}
         frame = inspect.currentframe().f_back
         self.pymodule = frame.f_globals["__name__"]
         for (key, value) in frame.f_locals.items():
@@ -540,12 +571,72 @@ class Cythonizer:
         with printtools.PrintStyle(color=33, font=4):
             print(f"Translate module/package {self.pyname}.")
         with printtools.PrintStyle(color=33, font=2):
-            self.pyxwriter.write()
+            pyxcode = self.pyxwriter.render()
+        hashvalue = self.calculate_hashvalue(pyxcode)
+        if (
+            not hydpy.pub.options.forcecompiling
+            and os.path.exists(self.dllfilepath)
+            and os.path.exists(self.hashfilepath)
+        ):
+            with open(self.hashfilepath) as hashfile:
+                if hashfile.read().strip() == hashvalue:
+                    with printtools.PrintStyle(color=31, font=4):
+                        print(f"Module {self.cyname} is still up-to-date.")
+                    os.utime(self.dllfilepath)
+                    return
+        self.pyxwriter.write(pyxcode)
         with printtools.PrintStyle(color=31, font=4):
             print(f"Compile module {self.cyname}.")
         with printtools.PrintStyle(color=31, font=2):
             self.compile_()
             self.move_dll()
+        with open(self.hashfilepath, "w") as hashfile:
+            hashfile.write(hashvalue)
+
+    def calculate_hashvalue(self, pyxcode: str) -> str:
+        """Return the SHA-256 hash value of the given Cython code combined
+        with the relevant information on the current build environment.
+
+        Method |Cythonizer.cythonize| compares the returned value with the
+        one stored in the file |Cythonizer.hashfilepath| to decide whether
+        the last compilation of identical Cython code is reusable.  Hence,
+        the hash value changes with the Cython code itself:
+
+        >>> from hydpy.models.hland_v1 import cythonizer
+        >>> hashvalue = cythonizer.calculate_hashvalue("x = 1")
+        >>> len(hashvalue)
+        64
+        >>> hashvalue == cythonizer.calculate_hashvalue("x = 1")
+        True
+        >>> hashvalue == cythonizer.calculate_hashvalue("x = 2")
+        False
+
+        It also changes with the versions of Python, Cython, and NumPy,
+        with the configuration options "FASTCYTHON", "PROFILECYTHON", and
+        "NATIVECYTHON", and with the declaration files ("pxd") of the
+        `autogen` folder, which the Cython code imports:
+
+        >>> from hydpy import config
+        >>> config.PROFILECYTHON = True
+        >>> hashvalue == cythonizer.calculate_hashvalue("x = 1")
+        False
+        >>> config.PROFILECYTHON = False
+        """
+        chunks = [
+            sys.version,
+            Cython.__version__,
+            numpy.__version__,
+            str(config.FASTCYTHON),
+            str(config.PROFILECYTHON),
+            str(config.NATIVECYTHON),
+        ]
+        for filename in sorted(os.listdir(self.cydirpath)):
+            if filename.endswith(".pxd"):
+                with open(os.path.join(self.cydirpath, filename)) as pxdfile:
+                    chunks.append(pxdfile.read())
+        chunks.append(pyxcode)
+        blob = "\n".join(chunks)
+        return hashlib.sha256(blob.encode()).hexdigest()
 
     @property
     def pyname(self) -> str:
@@ -656,6 +747,18 @@ class Cythonizer:
         """
         return os.path.join(self.cydirpath, f"{self.cyname}{_dllextension}")
 
+    @property
+    def hashfilepath(self) -> str:
+        """The absolute path of the file containing the hash value of the
+        Cython code of the compiled module.
+
+        >>> from hydpy.models.hland_v1 import cythonizer
+        >>> from hydpy import repr_
+        >>> repr_(cythonizer.hashfilepath)   # doctest: +ELLIPSIS
+        '.../hydpy/cythons/autogen/c_hland_v1.sha256'
+        """
+        return os.path.join(self.cydirpath, f"{self.cyname}.sha256")
+
     @property
     def buildpath(self) -> str:
         """The absolute path for temporarily build files.
@@ -730,8 +833,30 @@ class Cythonizer:
          'variabletools.py',
          'modelutils.py',
          'hland_v1.py']
+
+        Each |Cythonizer| instance collects the source files only once for
+        each *HydPy* base path and stores them in its `_pysourcefiles`
+        dictionary.  Later accesses do not inspect any classes:
+
+        >>> import hydpy
+        >>> hydpy.__path__[0] in cythonizer._pysourcefiles
+        True
+        >>> from unittest import mock
+        >>> with mock.patch("inspect.getmro") as getmro:
+        ...     filepaths = cythonizer.pysourcefiles
+        >>> getmro.called
+        False
+        >>> filepaths == list(cythonizer._pysourcefiles[hydpy.__path__[0]])
+        True
+
+        This cache is never invalidated, as the relevant classes do not
+        change after initialisation.  Changing the class hierarchy of a
+        model afterwards requires a new |Cythonizer| instance.
         """
         basepath = hydpy.__path__[0]  # type: ignore[attr-defined, name-defined]
+        pysourcefiles = self._pysourcefiles.get(basepath)
+        if pysourcefiles is not None:
+            return list(pysourcefiles)
         filepaths = set()
         for child in vars(self).values():
             try:
@@ -745,6 +870,7 @@ class Cythonizer:
                     continue
                 if basepath in filepath:
                     filepaths.add(filepath)
+        self._pysourcefiles[basepath] = tuple(filepaths)
         return list(filepaths)
 
     @property
@@ -824,32 +950,35 @@ class Cythonizer:
         if not os.path.exists(self.dllfilepath):
             return True
         cydate = os.stat(self.dllfilepath).st_mtime
-        for pysourcefile in self.pysourcefiles:
-            pydate = os.stat(pysourcefile).st_mtime
-            if pydate > cydate:
-                return True
-        return False
+        return any(
+            os.stat(pysourcefile).st_mtime > cydate
+            for pysourcefile in self.pysourcefiles
+        )
 
     def compile_(self) -> None:
         """Translate Cython code to C code and compile it."""
-        argv = copy.deepcopy(sys.argv)
+        argv = sys.argv
         sys.argv = [
-            sys.argv[0],
+            argv[0],
             "build_ext",
             "--build-lib=" + self.buildpath,
             "--build-temp=" + self.buildpath,
         ]
-        exc_modules = [
-            distutils.extension.Extension(
-                "hydpy.cythons.autogen." + self.cyname,
-                [self.pyxfilepath],
-                extra_compile_args=["-O2"],
+        try:
+            exc_modules = [
+                distutils.extension.Extension(
+                    "hydpy.cythons.autogen." + self.cyname,
+                    [self.pyxfilepath],
+                    extra_compile_args=["-O2"],
+                )
+            ]
+            distutils.core.setup(
+                ext_modules=build.cythonize(exc_modules),
+                include_dirs=[numpy.get_include()],
+                cmdclass={"build_ext": _BuildExt},
             )
-        ]
-        distutils.core.setup(
-            ext_modules=build.cythonize(exc_modules), include_dirs=[numpy.get_include()]
-        )
-        sys.argv = argv
+        finally:
+            sys.argv = argv
 
     def move_dll(self) -> None:
         """Try to find the DLL file created my method |Cythonizer.compile_|
@@ -895,46 +1024,41 @@ cython module `c_hland_v1...` does already exist in this directory \
 and is currently blocked by another Python process.  Maybe it helps \
 to close all Python processes and restart the cythonization afterwards.
         """
-        dirinfos = os.walk(self.buildpath)
-        system_dependent_filename = None
-        for dirinfo in dirinfos:
-            for filename in dirinfo[2]:
-                if filename.startswith(self.cyname) and filename.endswith(
-                    _dllextension
-                ):
-                    system_dependent_filename = filename
-                    break
-            if system_dependent_filename:
-                try:
-                    shutil.move(
-                        os.path.join(dirinfo[0], system_dependent_filename),
-                        os.path.join(self.cydirpath, self.cyname + _dllextension),
-                    )
-                    break
-                except BaseException:
-                    objecttools.augment_excmessage(
-                        f"After trying to cythonize module `{self.pyname}`, "
-                        f"when trying to move the final cython module "
-                        f"`{system_dependent_filename}` from directory "
-                        f"`{self.buildpath}` to directory "
-                        f"`{objecttools.repr_(self.cydirpath)}`",
-                        f"A likely error cause is that the cython module "
-                        f"`{self.cyname}{_dllextension}` does already exist "
-                        f"in this directory and is currently blocked by "
-                        f"another Python process.  Maybe it helps to close "
-                        f"all Python processes and restart the cythonization "
-                        f"afterwards.",
-                    )
-        else:
-            raise IOError(
-                f"After trying to cythonize model `{self.pyname}`, the "
-                f"resulting file `{self.cyname}{_dllextension}` could "
-                f"not be found in directory "
-                f"`{objecttools.repr_(self.buildpath)}` nor any of its "
-                f"subdirectories.  The distutil report should tell "
-                f"whether the file has been stored somewhere else, is "
-                f"named somehow else, or could not be build at all."
-            )
+        pattern = os.path.join(
+            glob.escape(self.buildpath),
+            "**",
+            f"{glob.escape(self.cyname)}*{_dllextension}",
+        )
+        for filepath in glob.iglob(pattern, recursive=True):
+            try:
+                shutil.move(
+                    filepath,
+                    os.path.join(self.cydirpath, self.cyname + _dllextension),
+                )
+                return
+            except BaseException:
+                objecttools.augment_excmessage(
+                    f"After trying to cythonize module `{self.pyname}`, "
+                    f"when trying to move the final cython module "
+                    f"`{os.path.basename(filepath)}` from directory "
+                    f"`{self.buildpath}` to directory "
+                    f"`{objecttools.repr_(self.cydirpath)}`",
+                    f"A likely error cause is that the cython module "
+                    f"`{self.cyname}{_dllextension}` does already exist "
+                    f"in this directory and is currently blocked by "
+                    f"another Python process.  Maybe it helps to close "
+                    f"all Python processes and restart the cythonization "
+                    f"afterwards.",
+                )
+        raise IOError(
+            f"After trying to cythonize model `{self.pyname}`, the "
+            f"resulting file `{self.cyname}{_dllextension}` could "
+            f"not be found in directory "
+            f"`{objecttools.repr_(self.buildpath)}` nor any of its "
+            f"subdirectories.  The distutil report should tell "
+            f"whether the file has been stored somewhere else, is "
+            f"named somehow else, or could not be build at all."
+        )
 
 
 class PyxWriter:
@@ -957,33 +1081,42 @@ class PyxWriter:
         self.model = model
         self.pyxpath = pyxpath
 
-    def write(self) -> None:
-        """Collect the source code and write it into a Cython extension
-        file ("pyx")."""
+    def render(self) -> str:
+        """Collect and return the complete source code of the Cython
+        extension file ("pyx")."""
+        chunks = []
+        print("    * cython options")
+        chunks.append(repr(self.cythondistutilsoptions))
+        print("    * C imports")
+        chunks.append(repr(self.cimports))
+        print("    * constants (if defined)")
+        chunks.append(repr(self.constants))
+        print("    * parameter classes")
+        chunks.append(repr(self.parameters))
+        print("    * sequence classes")
+        chunks.append(repr(self.sequences))
+        print("    * numerical parameters")
+        chunks.append(repr(self.numericalparameters))
+        print("    * submodel classes")
+        chunks.append(repr(self.submodels))
+        print("    * model class")
+        print("        - model attributes")
+        chunks.append(repr(self.modeldeclarations))
+        print("        - standard functions")
+        chunks.append(repr(self.modelstandardfunctions))
+        print("        - numeric functions")
+        chunks.append(repr(self.modelnumericfunctions))
+        print("        - additional functions")
+        chunks.append(repr(self.modeluserfunctions))
+        return "".join(chunks)
+
+    def write(self, pyxcode: Optional[str] = None) -> None:
+        """Write the given or, if omitted, the newly collected source code
+        into a Cython extension file ("pyx")."""
+        if pyxcode is None:
+            pyxcode = self.render()
         with open(self.pyxpath, "w") as pxf:
-            print("    * cython options")
-            pxf.write(repr(self.cythondistutilsoptions))
-            print("    * C imports")
-            pxf.write(repr(self.cimports))
-            print("    * constants (if defined)")
-            pxf.write(repr(self.constants))
-            print("    * parameter classes")
-            pxf.write(repr(self.parameters))
-            print("    * sequence classes")
-            pxf.write(repr(self.sequences))
-            print("    * numerical parameters")
-            pxf.write(repr(self.numericalparameters))
-            print("    * submodel classes")
-            pxf.write(repr(self.submodels))
-            print("    * model class")
-            print("        - model attributes")
-            pxf.write(repr(self.modeldeclarations))
-            print("        - standard functions")
-            pxf.write(repr(self.modelstandardfunctions))
-            print("        - numeric functions")
-            pxf.write(repr(self.modelnumericfunctions))
-            print("        - additional functions")
-            pxf.write(repr(self.modeluserfunctions))
+            pxf.write(pyxcode)
 
     @property
     def cythondistutilsoptions(self) -> List[str]:
@@ -1052,12 +1185,13 @@ class PyxWriter:
         return Lines(
             "import numpy",
             "cimport numpy",
-            "from libc.math cimport exp, fabs, log, "
+            "from libc.math cimport exp, fabs, fmax, log, "
             "sin, cos, tan, asin, acos, atan, isnan, isinf",
             "from libc.math cimport NAN as nan",
             "from libc.math cimport INFINITY as inf",
             "from libc.stdio cimport *",
             "from libc.stdlib cimport *",
+            "from libc.string cimport memcpy, memset",
             "import cython",
             "from cpython.mem cimport PyMem_Malloc",
             "from cpython.mem cimport PyMem_Realloc",
@@ -1074,11 +1208,12 @@ class PyxWriter:
     def constants(self) -> List[str]:
         """Constants declaration lines."""
         lines = Lines()
+        types_ = tuple(t for t in TYPE2STR if t)
         for (name, member) in vars(self.cythonizer).items():
             if (
                 name.isupper()
                 and not inspect.isclass(member)
-                and isinstance(member, tuple([t for t in TYPE2STR if t]))
+                and isinstance(member, types_)
             ):
                 ndim = numpy.array(member).ndim
                 ctype = TYPE2STR[type(member)] + NDIM2STR[ndim]
@@ -1139,14 +1274,15 @@ class PyxWriter:
                 for idx in range(seq.NDIM):
                     lines.add(1, f"cdef public int _{seq.name}_length_{idx}")
                 if seq.NUMERIC:
-                    ctype_numeric = "double" + NDIM2STR[seq.NDIM + 1]
+                    ctype_numeric = "double" + NDIM2CONTIGUOUSSTR[seq.NDIM + 1]
                     lines.add(1, f"cdef public {ctype_numeric} _{seq.name}_points")
                     lines.add(1, f"cdef public {ctype_numeric} _{seq.name}_results")
                     if isinstance(subseqs, sequencetools.FluxSequences):
                         lines.add(
                             1, f"cdef public {ctype_numeric} " f"_{seq.name}_integrals"
                         )
-                        lines.add(1, f"cdef public {ctype} _{seq.name}_sum")
+                        ctype_sum = "double" + NDIM2CONTIGUOUSSTR[seq.NDIM]
+                        lines.add(1, f"cdef public {ctype_sum} _{seq.name}_sum")
                 if isinstance(subseqs, sequencetools.IOSequences):
                     lines.extend(self.iosequence(seq))
             if isinstance(subseqs, sequencetools.IOSequences):
@@ -1248,6 +1384,14 @@ class PyxWriter:
             lines.add(2, f"elif self._{seq.name}_ramflag:")
             if seq.NDIM == 0:
                 lines.add(3, f"self.{seq.name} = self._{seq.name}_array[idx]")
+            elif config.FASTCYTHON:
+                zeros = ", ".join(seq.NDIM * "0")
+                lines.add(
+                    3,
+                    f"memcpy(&self.{seq.name}[{zeros}], "
+                    f"&self._{seq.name}_array[idx, {zeros}], "
+                    f"self._{seq.name}_length * sizeof(double))",
+                )
             else:
                 indexing = ""
                 for idx in range(seq.NDIM):
@@ -1291,6 +1435,14 @@ class PyxWriter:
             lines.add(indent, f"elif self._{seq.name}_ramflag:")
             if seq.NDIM == 0:
                 lines.add(indent + 1, f"self._{seq.name}_array[idx] = self.{seq.name}")
+            elif config.FASTCYTHON:
+                zeros = ", ".join(seq.NDIM * "0")
+                lines.add(
+                    indent + 1,
+                    f"memcpy(&self._{seq.name}_array[idx, {zeros}], "
+                    f"&self.{seq.name}[{zeros}], "
+                    f"self._{seq.name}_length * sizeof(double))",
+                )
             else:
                 indexing = ""
                 for idx in range(seq.NDIM):
@@ -1346,8 +1498,9 @@ class PyxWriter:
         lines.add(
             2, "cdef pointerutils.PDouble pointer = " "pointerutils.PDouble(value)"
         )
-        for seq in subseqs:
-            lines.add(2, f'if name == "{seq.name}":')
+        for idx, seq in enumerate(subseqs):
+            if_or_elif = "elif" if idx else "if"
+            lines.add(2, f'{if_or_elif} name == "{seq.name}":')
             lines.add(3, f"self.{seq.name} = pointer.p_value")
         return lines
 
@@ -1358,8 +1511,9 @@ class PyxWriter:
         lines = Lines()
         lines.add(1, "cpdef get_value(self, str name):")
         lines.add(2, "cdef int idx")
-        for seq in subseqs:
-            lines.add(2, f'if name == "{seq.name}":')
+        for idx, seq in enumerate(subseqs):
+            if_or_elif = "elif" if idx else "if"
+            lines.add(2, f'{if_or_elif} name == "{seq.name}":')
             if seq.NDIM == 0:
                 lines.add(3, f"return self.{seq.name}[0]")
             elif seq.NDIM == 1:
@@ -1376,8 +1530,9 @@ class PyxWriter:
         print("            . set_value")
         lines = Lines()
         lines.add(1, "cpdef set_value(self, str name, value):")
-        for seq in subseqs:
-            lines.add(2, f'if name == "{seq.name}":')
+        for idx, seq in enumerate(subseqs):
+            if_or_elif = "elif" if idx else "if"
+            lines.add(2, f'{if_or_elif} name == "{seq.name}":')
             if seq.NDIM == 0:
                 lines.add(3, f"self.{seq.name}[0] = value")
             elif seq.NDIM == 1:
@@ -1399,8 +1554,9 @@ class PyxWriter:
         print("            . setlength")
         lines = Lines()
         lines.add(1, f"cpdef inline alloc(self, name, {TYPE2STR[int]} length):")
-        for seq in subseqs:
-            lines.add(2, f'if name == "{seq.name}":')
+        for idx, seq in enumerate(subseqs):
+            if_or_elif = "elif" if idx else "if"
+            lines.add(2, f'{if_or_elif} name == "{seq.name}":')
             lines.add(3, f"self._{seq.name}_length_0 = length")
             lines.add(
                 3,
@@ -1420,8 +1576,9 @@ class PyxWriter:
         print("            . dealloc")
         lines = Lines()
         lines.add(1, "cpdef inline dealloc(self, name):")
-        for seq in subseqs:
-            lines.add(2, f'if name == "{seq.name}":')
+        for idx, seq in enumerate(subseqs):
+            if_or_elif = "elif" if idx else "if"
+            lines.add(2, f'{if_or_elif} name == "{seq.name}":')
             lines.add(3, f"PyMem_Free(self.{seq.name})")
         return lines
 
@@ -1438,8 +1595,9 @@ class PyxWriter:
         lines.add(
             2, "cdef pointerutils.PDouble pointer = " "pointerutils.PDouble(value)"
         )
-        for seq in subseqs:
-            lines.add(2, f'if name == "{seq.name}":')
+        for idx, seq in enumerate(subseqs):
+            if_or_elif = "elif" if idx else "if"
+            lines.add(2, f'{if_or_elif} name == "{seq.name}":')
             lines.add(3, f"self.{seq.name}[idx] = pointer.p_value")
             lines.add(3, f"self._{seq.name}_ready[idx] = 1")
         return lines
@@ -1454,8 +1612,9 @@ class PyxWriter:
             "cpdef inline set_pointerinput"
             "(self, str name, pointerutils.PDouble value):",
         )
-        for seq in subseqs:
-            lines.add(2, f'if name == "{seq.name}":')
+        for idx, seq in enumerate(subseqs):
+            if_or_elif = "elif" if idx else "if"
+            lines.add(2, f'{if_or_elif} name == "{seq.name}":')
             lines.add(3, f"self._{seq.name}_inputpointer = value.p_value")
         return lines
 
@@ -1473,8 +1632,9 @@ class PyxWriter:
         )
         subseqs = self._filter_outputsequences(subseqs)
         if subseqs:
-            for seq in subseqs:
-                lines.add(2, f'if name == "{seq.name}":')
+            for idx, seq in enumerate(subseqs):
+                if_or_elif = "elif" if idx else "if"
+                lines.add(2, f'{if_or_elif} name == "{seq.name}":')
                 lines.add(3, f"self._{seq.name}_outputpointer = value.p_value")
         else:
             lines.add(2, "pass")
@@ -1720,6 +1880,15 @@ class PyxWriter:
                         f"self.sequences.old_states.{seq.name} = "
                         f"self.sequences.new_states.{seq.name}",
                     )
+                elif config.FASTCYTHON:
+                    zeros = ", ".join(seq.NDIM * "0")
+                    lines.add(
+                        2,
+                        f"memcpy(&self.sequences.old_states.{seq.name}[{zeros}], "
+                        f"&self.sequences.new_states.{seq.name}[{zeros}], "
+                        f"self.sequences.states._{seq.name}_length "
+                        f"* sizeof(double))",
+                    )
                 else:
                     indexing = ""
                     for idx in range(seq.NDIM):
@@ -1868,16 +2037,28 @@ class PyxWriter:
         subseqs = list(subseqs)
         from1 = f"self.sequences.{subseqs_name}.%s"
         to1 = f"self.sequences.{subseqs_name}._%s_{target}"
+        from0 = f"{from1}[%s]"
+        to0 = f"{to1}[%s]"
         if index is not None:
+            to0 = f"{to1}[self.numvars.{index}, %s]"
             to1 += f"[self.numvars.{index}]"
         if load:
             from1, to1 = to1, from1
+            from0, to0 = to0, from0
         yield from PyxWriter._declare_idxs(subseqs)
         for seq in subseqs:
             from2 = from1 % seq.name
             to2 = to1 % seq.name
             if seq.NDIM == 0:
                 yield f"{to2} = {from2}"
+            elif (seq.NDIM in (1, 2)) and config.FASTCYTHON:
+                zeros = ", ".join(seq.NDIM * ["0"])
+                yield (
+                    f"memcpy(&{to0 % (seq.name, zeros)}, "
+                    f"&{from0 % (seq.name, zeros)}, "
+                    f"self.sequences.{subseqs_name}._{seq.name}_length "
+                    f"* sizeof(double))"
+                )
             elif seq.NDIM == 1:
                 yield (
                     f"for idx0 in range(self.sequences."
@@ -1987,6 +2168,8 @@ class PyxWriter:
             yield "cdef int jdx, idx0"
         elif max_ndim == 2:
             yield "cdef int jdx, idx0, idx1"
+        if max_ndim > 0:
+            yield "cdef double coef"
         for seq in self.model.sequences.fluxes.numericsequences:
             to_ = f"self.sequences.fluxes.{seq.name}"
             from_ = f"self.sequences.fluxes._{seq.name}_points"
@@ -1999,28 +2182,26 @@ class PyxWriter:
                 yield "for jdx in range(self.numvars.idx_method):"
                 yield f"    {to_} = {to_} +{coefs}*{from_}[jdx]"
             elif seq.NDIM == 1:
-                yield (
-                    f"for idx0 in " f"range(self.sequences.fluxes._{seq.name}_length):"
-                )
+                loop0 = f"for idx0 in range(self.sequences.fluxes._{seq.name}_length):"
+                yield loop0
                 yield f"    {to_}[idx0] = 0."
-                yield "    for jdx in range(self.numvars.idx_method):"
-                yield (
-                    f"        {to_}[idx0] = "
-                    f"{to_}[idx0] + {coefs}*{from_}[jdx, idx0]"
-                )
+                yield "for jdx in range(self.numvars.idx_method):"
+                yield f"    coef = {coefs}"
+                yield f"    {loop0}"
+                yield f"        {to_}[idx0] = {to_}[idx0] + coef*{from_}[jdx, idx0]"
             elif seq.NDIM == 2:
-                yield (
-                    f"for idx0 in " f"range(self.sequences.fluxes._{seq.name}_length0):"
-                )
-                yield (
-                    f"    for idx1 in range("
-                    f"self.sequences.fluxes._{seq.name}_length1):"
-                )
+                loop0 = f"for idx0 in range(self.sequences.fluxes._{seq.name}_length0):"
+                loop1 = f"for idx1 in range(self.sequences.fluxes._{seq.name}_length1):"
+                yield loop0
+                yield f"    {loop1}"
                 yield f"        {to_}[idx0, idx1] = 0."
-                yield "        for jdx in range(self.numvars.idx_method):"
+                yield "for jdx in range(self.numvars.idx_method):"
+                yield f"    coef = {coefs}"
+                yield f"    {loop0}"
+                yield f"        {loop1}"
                 yield (
                     f"            {to_}[idx0, idx1] = "
-                    f"{to_}[idx0, idx1] + {coefs}*{from_}[jdx, idx0, idx1]"
+                    f"{to_}[idx0, idx1] + coef*{from_}[jdx, idx0, idx1]"
                 )
             else:
                 raise NotImplementedError(
@@ -2036,6 +2217,11 @@ class PyxWriter:
             to_ = f"self.sequences.fluxes._{seq.name}_sum"
             if seq.NDIM == 0:
                 yield f"{to_} = 0."
+            elif (seq.NDIM == 1) and config.FASTCYTHON:
+                yield (
+                    f"memset(&{to_}[0], 0, "
+                    f"self.sequences.fluxes._{seq.name}_length * sizeof(double))"
+                )
             elif seq.NDIM == 1:
                 yield (
                     f"for idx0 in " f"range(self.sequences.fluxes._{seq.name}_length):"
@@ -2110,13 +2296,13 @@ class PyxWriter:
             results = f"self.sequences.fluxes._{seq.name}_results"
             if seq.NDIM == 0:
                 yield f"abserror = fabs(" f"{results}[{index}]-{results}[{index}-1])"
-                yield f"{abserror} = max({abserror}, abserror)"
+                yield f"{abserror} = fmax({abserror}, abserror)"
                 yield f"if {userel}"
                 yield f"    if {results}[{index}] == 0.:"
                 yield f"        {relerror} = inf"
                 yield "    else:"
                 yield (
-                    f"        {relerror} = max("
+                    f"        {relerror} = fmax("
                     f"{relerror}, fabs(abserror/{results}[{index}]))"
                 )
             elif seq.NDIM == 1:
@@ -2127,13 +2313,13 @@ class PyxWriter:
                     f"    abserror = fabs("
                     f"{results}[{index}, idx0]-{results}[{index}-1, idx0])"
                 )
-                yield f"    {abserror} = max({abserror}, abserror)"
+                yield f"    {abserror} = fmax({abserror}, abserror)"
                 yield f"    if {userel}"
                 yield f"        if {results}[{index}, idx0] == 0.:"
                 yield f"            {relerror} = inf"
                 yield "        else:"
                 yield (
-                    f"            {relerror} = max("
+                    f"            {relerror} = fmax("
                     f"{relerror}, fabs(abserror/{results}[{index}, idx0]))"
                 )
             elif seq.NDIM == 2:
@@ -2149,13 +2335,13 @@ class PyxWriter:
                     f"        abserror = fabs({results}[{index}, "
                     f"idx0, idx1]-{results}[{index}-1, idx0, idx1])"
                 )
-                yield f"        {abserror} = max({abserror}, abserror)"
+                yield f"        {abserror} = fmax({abserror}, abserror)"
                 yield f"        if {userel}"
                 yield f"            if {results}[{index}, idx0, idx1] == 0.:"
                 yield f"                {relerror} = inf"
                 yield "            else:"
                 yield (
-                    f"                {relerror} = max("
+                    f"                {relerror} = fmax("
                     f"{relerror}, "
                     f"fabs(abserror/{results}[{index}, idx0, idx1]))"
                 )
@@ -2313,6 +2499,7 @@ class FuncConverter:
         self.model = model
         self.funcname = funcname
         vars(self)["func"] = func
+        self._cleanlines: Optional[Tuple[str, ...]] = None
 
     @property
     def argnames(self) -> List[str]:
@@ -2430,12 +2617,8 @@ class FuncConverter:
         >>> FuncConverter(model, None, model.calc_tc_v1).untypedarguments
         []
         """
-        defline = self.cleanlines[0]
-        return [
-            name
-            for name in self.untypedvarnames
-            if ((f", {name}," in defline) or (f", {name})" in defline))
-        ]
+        argnames = set(self.argnames[1:])
+        return [name for name in self.untypedvarnames if name in argnames]
 
     @property
     def untypedinternalvarnames(self) -> List[str]:
@@ -2468,13 +2651,45 @@ class FuncConverter:
           * remove all lines containing the phrase `fastaccess`
           * replace all shortcuts with complete reference names
           * replace "model." with "self."
+
+        |FuncConverter| prepares the cleaned lines on the first access
+        only (which requires reading the function's source code):
+
+        >>> from hydpy.cythons.modelutils import FuncConverter
+        >>> from hydpy import prepare_model, pub
+        >>> with pub.options.usecython(False):
+        ...     model = prepare_model("hland_v1")
+        >>> funcconverter = FuncConverter(model, "calc_tc_v1", model.calc_tc_v1)
+        >>> funcconverter._cleanlines is None
+        True
+        >>> funcconverter.cleanlines[0]
+        'def calc_tc_v1(self):'
+        >>> funcconverter._cleanlines[0]
+        'def calc_tc_v1(self):'
+        >>> from unittest import mock
+        >>> with mock.patch.object(funcconverter, "_prepare_cleanlines") as prepare:
+        ...     funcconverter.cleanlines[0]
+        'def calc_tc_v1(self):'
+        >>> prepare.call_count
+        0
         """
+        if self._cleanlines is None:
+            self._cleanlines = tuple(self._prepare_cleanlines())
+        return Lines(*self._cleanlines)
+
+    def _prepare_cleanlines(self) -> List[str]:
         code = inspect.getsource(self.func)
         code = "\n".join(code.split('"""')[::2])
         code = code.replace("modelutils.", "")
         code = code.replace("model.", "self.")
-        for (name, shortcut) in zip(self.subgroupnames, self.subgroupshortcuts):
-            code = code.replace(f"{shortcut}.", f"self.{name}.")
+        shortcut2name = dict(zip(self.subgroupshortcuts, self.subgroupnames))
+        if shortcut2name:
+            shortcuts = "|".join(re.escape(shortcut) for shortcut in shortcut2name)
+            code = re.sub(
+                rf"\b({shortcuts})\.",
+                lambda match: f"self.{shortcut2name[match.group(1)]}.",
+                code,
+            )
         code = self.remove_linebreaks_within_equations(code)
         lines = code.splitlines()
         self.remove_imath_operators(lines)
@@ -2485,8 +2700,7 @@ class FuncConverter:
         lines[0] = f"def {self.funcname}({', '.join(argnames)}):"
         lines = [line.split("#")[0] for line in lines]
         lines = [line for line in lines if "fastaccess" not in line]
-        lines = [line.rstrip() for line in lines if line.rstrip()]
-        return Lines(*lines)
+        return [line.rstrip() for line in lines if line.rstrip()]
 
     @staticmethod
     def remove_linebreaks_within_equations(code: str) -> str:
@@ -2499,18 +2713,26 @@ class FuncConverter:
         >>> from hydpy.cythons.modelutils import FuncConverter
         >>> FuncConverter.remove_linebreaks_within_equations(code)
         'asdf = (a+b)'
+
+        Line breaks within nested brackets are removed as well, while
+        those outside of all brackets remain:
+
+        >>> code = "x = f(a,\n[b,\nc])\ny = {1:\n2}"
+        >>> FuncConverter.remove_linebreaks_within_equations(code)
+        'x = f(a,[b,c])\ny = {1:2}'
         """
         code = code.replace("\\\n", "")
-        chars = []
+        substrings = []
         counter = 0
-        for char in code:
-            if char in ("(", "[", "{"):
+        for substring in _BRACKETS_AND_LINEBREAKS.split(code):
+            if substring in ("(", "[", "{"):
                 counter += 1
-            elif char in (")", "]", "}"):
+            elif substring in (")", "]", "}"):
                 counter -= 1
-            if not (counter and (char == "\n")):
-                chars.append(char)
-        return "".join(chars)
+            elif counter and (substring == "\n"):
+                continue
+            substrings.append(substring)
+        return "".join(substrings)
 
     @staticmethod
     def remove_imath_operators(lines: List[str]):
@@ -2525,18 +2747,24 @@ class FuncConverter:
         >>> FuncConverter.remove_imath_operators(lines)
         >>> lines
         ['    x = x + (1*1)']
+
+        Multi-character operators like `**=` and `//=` are handled as
+        well, and lines without augmented assignments remain unchanged:
+
+        >>> lines = ["x **= 2", "        y //= a+b", "z = 1"]
+        >>> FuncConverter.remove_imath_operators(lines)
+        >>> lines
+        ['x = x ** (2)', '        y = y // (a+b)', 'z = 1']
         """
         for idx, line in enumerate(lines):
-            for operator in ("+=", "-=", "**=", "*=", "//=", "/=", "%="):
-                sublines = line.split(operator)
-                if len(sublines) > 1:
-                    indent = line.count(" ") - line.lstrip().count(" ")
-                    sublines = [sl.strip() for sl in sublines]
-                    line = (
-                        f"{indent*' '}{sublines[0]} = "
-                        f"{sublines[0]} {operator[:-1]} ({sublines[1]})"
-                    )
-                    lines[idx] = line
+            match = _IMATH_OPERATORS.search(line)
+            if match:
+                indent = len(line) - len(line.lstrip())
+                target = line[: match.start()].strip()
+                expression = line[match.end() :].strip()
+                operator = match.group()[:-1]
+                line = f"{line[:indent]}{target} = {target} {operator} ({expression})"
+                lines[idx] = line
 
     @property
     def pyxlines(self) -> List[str]: